@@ -63,18 +63,135 @@ import os
 import logging
 import warnings
 from collections import defaultdict
+try:
+    from collections.abc import Mapping
+except ImportError:  # python 2
+    from collections import Mapping
 import itertools as it
 from math import log
 from inspect import getargspec
 import pickle
 import six
 
-from six import iteritems, string_types, next
+import numpy as np
+
+from six import iteritems, itervalues, string_types, next
+from six.moves import zip
 
 from gensim import utils, interfaces
 
 logger = logging.getLogger(__name__)
 
+
+def _count_bigrams_py(sentences, vocab, interned, max_vocab_size, min_reduce):
+    """
+    Update `vocab` with the unigram and bigram counts from a batch of `sentences`,
+    pruning it whenever its size exceeds `max_vocab_size`. Bigrams are counted
+    under `(word_a, word_b)` tuple keys.
+
+    Tokens are interned through the `interned` dict, so that repeated tokens (and the
+    bigram tuples built from them) share a single bytestring object. It is cleared on
+    every prune.
+
+    Return the number of words and sentences processed, and the updated `min_reduce`.
+
+    This is the pure python version of `gensim.models.phrases_inner.count_bigrams`,
+    used when the compiled extension is not available.
+
+    """
+    total_words = 0
+    total_sentences = 0
+    intern = interned.setdefault
+    for sentence in sentences:
+        total_sentences += 1
+        prev_word = None
+        for word in sentence:
+            word = utils.any2utf8(word)
+            word = intern(word, word)
+            vocab[word] += 1
+            if prev_word is not None:
+                vocab[(prev_word, word)] += 1
+            prev_word = word
+            total_words += 1
+
+        if len(vocab) > max_vocab_size:
+            utils.prune_vocab(vocab, min_reduce)
+            interned.clear()
+            min_reduce += 1
+
+    return total_words, total_sentences, min_reduce
+
+
+def _merge_counts_py(vocab, other):
+    """
+    Add the counts of all keys in the `other` dict to the ones in `vocab`.
+
+    This is the pure python version of `gensim.models.phrases_inner.merge_counts`,
+    used when the compiled extension is not available.
+
+    """
+    for word, count in iteritems(other):
+        vocab[word] += count
+
+
+def _apply_phrases_py(sentence, phrase_index, phrase_scores, delimiter, threshold):
+    """
+    Return the tokens of `sentence` as a list of unicode strings, with each bigram
+    whose row in `phrase_index` scores above `threshold` in `phrase_scores` joined
+    into a single token by the unicode `delimiter`. `phrase_index` is keyed by
+    `(word_a, word_b)` tuples of unicode strings. A word that was joined into a
+    phrase can't start another one.
+
+    This is the pure python version of `gensim.models.phrases_inner.apply_phrases`,
+    used when the compiled extension is not available.
+
+    """
+    new_s = []
+    # convert and check each word in a single pass; prev_word is None when the
+    # previous word was already emitted as part of a phrase
+    prev_word = None
+    for word in sentence:
+        word = utils.to_unicode(word)
+        if prev_word is not None:
+            bigram = (prev_word, word)
+            row = phrase_index.get(bigram, -1)
+            if row >= 0 and phrase_scores[row] > threshold:
+                new_s.append(delimiter.join(bigram))
+                prev_word = None
+                continue
+            new_s.append(prev_word)
+        prev_word = word
+
+    if prev_word is not None:  # add last word skipped by previous loop
+        new_s.append(prev_word)
+
+    return new_s
+
+
+try:
+    from gensim.models.phrases_inner import count_bigrams, merge_counts, apply_phrases
+except ImportError:
+    # failed... fall back to plain python
+    count_bigrams, merge_counts, apply_phrases = _count_bigrams_py, _merge_counts_py, _apply_phrases_py
+
+
+def _token_batches(sentences, batch_words):
+    """
+    Yield the utf8 tokens of consecutive `sentences` as lists of about `batch_words` tokens, with a None
+    after each sentence so that no bigram spans two sentences. A batch is closed after the sentence that
+    brings it to `batch_words` tokens, so that only whole sentences are batched.
+    """
+    batch = []
+    for sentence in sentences:
+        batch.extend(map(utils.any2utf8, sentence))
+        batch.append(None)
+        if len(batch) >= batch_words:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def _is_single(obj):
     """
     Check whether `obj` is a single document or an entire corpus.
@@ -84,6 +201,9 @@ def _is_single(obj):
     `obj` is a single document if it is an iterable of strings.  It
     is a corpus if it is an iterable of documents.
     """
+    if isinstance(obj, list):
+        # the common case: decide from the first item and return the list itself, no iterator needed
+        return not obj or isinstance(obj[0], string_types), obj
     obj_iter = iter(obj)
     try:
         peek = next(obj_iter)
@@ -190,31 +310,33 @@ class Phrases(interfaces.TransformationABC):
                 raise ValueError('unknown scoring method string %s specified' % (scoring))
 
         scoring_parameters = ['worda_count', 'wordb_count', 'bigram_count', 'len_vocab', 'min_count', 'corpus_word_count']
-        if callable(scoring):
+        if scoring is original_scorer or scoring is npmi_scorer:
+            # built-in scorers are known to take the expected parameters and to be picklable
+            self.scoring = scoring
+        elif callable(scoring):
             if all(parameter in getargspec(scoring)[0] for parameter in scoring_parameters):
                 self.scoring = scoring
             else:
                 raise ValueError('scoring function missing expected parameters')
 
+            # ensure picklability of custom scorer
+            try:
+                pickle.loads(pickle.dumps(scoring))
+            except pickle.PickleError:
+                raise pickle.PickleError('unable to pickle custom Phrases scoring function')
+        else:
+            raise ValueError('scoring should be a string or a function, got %r' % (scoring,))
+
         self.min_count = min_count
         self.threshold = threshold
         self.max_vocab_size = max_vocab_size
-        self.vocab = defaultdict(int)  # mapping between utf8 token => its count
+        self.vocab = defaultdict(int)  # mapping between utf8 token or (token, token) bigram => its count
+        self.bigrams_as_tuples = True  # bigrams are keyed by tuples, not by delimiter-joined tokens as in older versions
         self.min_reduce = 1  # ignore any tokens with count smaller than this
         self.delimiter = delimiter
         self.progress_per = progress_per
         self.corpus_word_count = 0
 
-        # ensure picklability of custom scorer
-        try:
-            test_pickle = pickle.dumps(self.scoring)
-            load_pickle = pickle.loads(test_pickle)
-        except pickle.PickleError:
-            raise pickle.PickleError('unable to pickle custom Phrases scoring function')
-        finally:
-            del(test_pickle)
-            del(load_pickle)
-
         if sentences is not None:
             self.add_vocab(sentences)
 
@@ -227,32 +349,36 @@ class Phrases(interfaces.TransformationABC):
 
     @staticmethod
     def learn_vocab(sentences, max_vocab_size, delimiter=b'_', progress_per=10000):
-        """Collect unigram/bigram counts from the `sentences` iterable."""
+        """
+        Collect unigram/bigram counts from the `sentences` iterable.
+
+        Unigrams are keyed by their utf8 bytestring, bigrams by a `(word_a, word_b)` tuple
+        of those. `delimiter` is only kept for backward compatibility of the signature.
+
+        The sentences are streamed into the counting one by one, and progress is logged
+        every `progress_per` sentences.
+
+        """
         sentence_no = -1
         total_words = 0
         logger.info("collecting all words and their counts")
         vocab = defaultdict(int)
+        interned = {}  # utf8 token => its canonical bytestring object, shared by all its vocab keys
         min_reduce = 1
-        for sentence_no, sentence in enumerate(sentences):
-            if sentence_no % progress_per == 0:
-                logger.info(
-                    "PROGRESS: at sentence #%i, processed %i words and %i word types",
-                    sentence_no, total_words, len(vocab)
-                )
-            sentence = [utils.any2utf8(w) for w in sentence]
-            for bigram in zip(sentence, sentence[1:]):
-                vocab[bigram[0]] += 1
-                vocab[delimiter.join(bigram)] += 1
-                total_words += 1
-
-            if sentence:  # add last word skipped by previous loop
-                word = sentence[-1]
-                vocab[word] += 1
-                total_words += 1
-
-            if len(vocab) > max_vocab_size:
-                utils.prune_vocab(vocab, min_reduce)
-                min_reduce += 1
+        sentences = iter(sentences)
+        for sentence in sentences:  # the first sentence of each batch of `progress_per` sentences
+            logger.info(
+                "PROGRESS: at sentence #%i, processed %i words and %i word types",
+                sentence_no + 1, total_words, len(vocab)
+            )
+            # the counting itself runs over the whole batch at once, in C if compiled, reading
+            # the sentences straight from the stream without collecting them into a list first
+            batch = it.chain([sentence], it.islice(sentences, progress_per - 1))
+            words, batch_sentences, min_reduce = count_bigrams(
+                batch, vocab, interned, max_vocab_size, min_reduce
+            )
+            total_words += words
+            sentence_no += batch_sentences
 
         logger.info(
             "collected %i word types from a corpus of %i words (unigram + bigrams) and %i sentences",
@@ -270,14 +396,18 @@ class Phrases(interfaces.TransformationABC):
         # directly, but gives the new sentences a fighting chance to collect
         # sufficient counts, before being pruned out by the (large) accummulated
         # counts collected in previous learn_vocab runs.
-        min_reduce, vocab, total_words = self.learn_vocab(sentences, self.max_vocab_size, self.delimiter, self.progress_per)
+        min_reduce, vocab, total_words = self.learn_vocab(
+            sentences, self.max_vocab_size, self.delimiter, self.progress_per
+        )
 
         self.corpus_word_count += total_words
         if len(self.vocab) > 0:
             logger.info("merging %i counts into %s", len(vocab), self)
             self.min_reduce = max(self.min_reduce, min_reduce)
-            for word, count in iteritems(vocab):
-                self.vocab[word] += count
+            if len(vocab) > len(self.vocab):
+                # the sum is the same either way, so walk the smaller of the two dicts
+                self.vocab, vocab = vocab, self.vocab
+            merge_counts(self.vocab, vocab)
             if len(self.vocab) > self.max_vocab_size:
                 utils.prune_vocab(self.vocab, self.min_reduce)
                 self.min_reduce += 1
@@ -287,7 +417,7 @@ class Phrases(interfaces.TransformationABC):
             logger.info("using %i counts as vocab in %s", len(vocab), self)
             self.vocab = vocab
 
-    def export_phrases(self, sentences, out_delimiter=b' ', as_tuples=False):
+    def export_phrases(self, sentences, out_delimiter=b' ', as_tuples=False, batch_words=10000):
         """
         Generate an iterator that contains all phrases in given 'sentences'
 
@@ -299,42 +429,73 @@ class Phrases(interfaces.TransformationABC):
           ...     print(u'{0}\t{1}'.format(phrase, score))
 
             then you can debug the threshold with generated tsv
+
+        `sentences` are processed in batches of about `batch_words` words (a batch holds at least one
+        whole sentence): the candidate bigrams of the whole batch are scored at once, in a single
+        vectorized call for the built-in scoring functions.
         """
 
         vocab = self.vocab
+        vocab_get = vocab.get  # not vocab[], which would insert missing tokens into the defaultdict
         threshold = self.threshold
-        delimiter = self.delimiter  # delimiter used for lookup
         min_count = self.min_count
         scorer = self.scoring
         # made floats for scoring function
         len_vocab = float(len(vocab))
         scorer_min_count = float(min_count)
         corpus_word_count = float(self.corpus_word_count)
+        # the built-in scorers have a version that works elementwise on whole arrays of counts
+        if scorer is original_scorer:
+            array_scorer = original_scorer
+        elif scorer is npmi_scorer:
+            array_scorer = _npmi_scorer_array
+        else:
+            array_scorer = None
+
+        for s in _token_batches(sentences, batch_words):
+            # every token is looked up in vocab once, here; the ones not there get a zero count and are
+            # replaced by None, so a single bigram lookup per position is enough to find the candidates below
+            word_counts = [vocab_get(w, 0) for w in s]
+            s = [w if count else None for w, count in zip(s, word_counts)]
+
+            # collect the position and counts of all candidates = bigrams with both words and the bigram in vocab
+            positions, counts = [], []
+            for pos, bigram in enumerate(zip(s, it.islice(s, 1, None))):
+                if bigram in vocab:
+                    positions.append(pos)
+                    counts.extend((word_counts[pos], word_counts[pos + 1], vocab[bigram]))
+            if not positions:
+                continue
+            counts_a, counts_b, counts_ab = np.array(counts, dtype=np.float64).reshape(-1, 3).T
 
-        for sentence in sentences:
-            s = [utils.any2utf8(w) for w in sentence]
-            last_bigram = False
-
-            for word_a, word_b in zip(s, s[1:]):
-                # last bigram check was moved here to save a few CPU cycles
-                if word_a in vocab and word_b in vocab and not last_bigram:
-                    bigram_word = delimiter.join((word_a, word_b))
-                    if bigram_word in vocab:
-                        count_a = float(vocab[word_a])
-                        count_b = float(vocab[word_b])
-                        count_ab = float(vocab[bigram_word])
-                        # scoring MUST have all these parameters, even if they are not used
-                        score = scorer(worda_count=count_a, wordb_count=count_b, bigram_count=count_ab, len_vocab=len_vocab, min_count=scorer_min_count, corpus_word_count=corpus_word_count)
-                        # logger.debug("score for %s: (pab=%s - min_count=%s) / pa=%s / pb=%s * vocab_size=%s = %s",
-                        #     bigram_word, count_ab, scorer_min_count, count_a, count_ab, len_vocab, score)
-                        if score > threshold and count_ab >= min_count:
-                            if as_tuples:
-                                yield ((word_a, word_b), score)
-                            else:
-                                yield (out_delimiter.join((word_a, word_b)), score)
-                            last_bigram = True
-                            continue
-                last_bigram = False
+            # scoring MUST have all these parameters, even if they are not used
+            if array_scorer is not None:
+                scores = array_scorer(
+                    worda_count=counts_a, wordb_count=counts_b, bigram_count=counts_ab, len_vocab=len_vocab,
+                    min_count=scorer_min_count, corpus_word_count=corpus_word_count
+                )
+            else:
+                scores = np.array([
+                    scorer(
+                        worda_count=count_a, wordb_count=count_b, bigram_count=count_ab, len_vocab=len_vocab,
+                        min_count=scorer_min_count, corpus_word_count=corpus_word_count
+                    )
+                    for count_a, count_b, count_ab in zip(counts_a.tolist(), counts_b.tolist(), counts_ab.tolist())
+                ])
+            is_phrase = (scores > threshold) & (counts_ab >= min_count)
+
+            scores = scores.tolist()
+            last_phrase = None  # the second word of an emitted phrase can't start another one
+            for i in np.flatnonzero(is_phrase).tolist():
+                pos = positions[i]
+                if pos - 1 == last_phrase:
+                    continue
+                last_phrase = pos
+                bigram = (s[pos], s[pos + 1])
+                if as_tuples:
+                    yield (bigram, scores[i])
+                else:
+                    yield (out_delimiter.join(bigram), scores[i])
 
     def __getitem__(self, sentence):
         """
@@ -357,9 +518,15 @@ class Phrases(interfaces.TransformationABC):
         """
         warnings.warn("For a faster implementation, use the gensim.models.phrases.Phraser class")
 
+        is_single, sentence = _is_single(sentence)
+        if not is_single:
+            # if the input is an entire corpus (rather than a single sentence),
+            # return an iterable stream.
+            return self._apply(sentence)
+
         vocab = self.vocab
         threshold = self.threshold
-        delimiter = self.delimiter  # delimiter used for lookup
+        delimiter = self.delimiter
         min_count = self.min_count
         scorer = self.scoring
         # made floats for scoring function
@@ -367,49 +534,40 @@ class Phrases(interfaces.TransformationABC):
         scorer_min_count = float(min_count)
         corpus_word_count = float(self.corpus_word_count)
 
-        is_single, sentence = _is_single(sentence)
-        if not is_single:
-            # if the input is an entire corpus (rather than a single sentence),
-            # return an iterable stream.
-            return self._apply(sentence)
-
+        # words are looked up as utf8 and decoded back to unicode as they are appended to new_s
         s, new_s = [utils.any2utf8(w) for w in sentence], []
-        last_bigram = False
-        vocab = self.vocab
 
-        for word_a, word_b in zip(s, s[1:]):
-            # last bigram check was moved here to save a few CPU cycles
-            if word_a in vocab and word_b in vocab and not last_bigram:
-                bigram_word = delimiter.join((word_a, word_b))
-                if bigram_word in vocab:
+        # i = position of the next word to emit; a detected phrase consumes two words
+        i, last = 0, len(s) - 1
+        while i < last:
+            word_a, word_b = s[i], s[i + 1]
+            if word_a in vocab and word_b in vocab:
+                bigram = (word_a, word_b)
+                if bigram in vocab:
                     count_a = float(vocab[word_a])
                     count_b = float(vocab[word_b])
-                    count_ab = float(vocab[bigram_word])
+                    count_ab = float(vocab[bigram])
                     # scoring MUST have all these parameters, even if they are not used
                     score = scorer(worda_count=count_a, wordb_count=count_b, bigram_count=count_ab, len_vocab=len_vocab, min_count=scorer_min_count, corpus_word_count=corpus_word_count)
                     # logger.debug("score for %s: (pab=%s - min_count=%s) / pa=%s / pb=%s * vocab_size=%s = %s",
                     #     bigram_word, count_ab, scorer_min_count, count_a, count_ab, len_vocab, score)
                     if score > threshold and count_ab >= min_count:
-                        new_s.append(bigram_word)
-                        last_bigram = True
+                        new_s.append(delimiter.join(bigram).decode('utf8'))
+                        i += 2
                         continue
+            new_s.append(word_a.decode('utf8'))
+            i += 1
 
-            if not last_bigram:
-                new_s.append(word_a)
-            last_bigram = False
+        if i == last:  # add last word, unless it was already part of a phrase
+            new_s.append(s[last].decode('utf8'))
 
-        if s:  # add last word skipped by previous loop
-            last_token = s[-1]
-            if not last_bigram:
-                new_s.append(last_token)
-
-        return [utils.to_unicode(w) for w in new_s]
+        return new_s
 
     @classmethod
     def load(cls, *args, **kwargs):
         """
         Load a previously saved Phrases class. Handles backwards compatibility from older Phrases versions which did not support
-            pluggable scoring functions. Otherwise, relies on utils.load
+            pluggable scoring functions, or stored bigrams under delimiter-joined keys. Otherwise, relies on utils.load
         """
 
         # for python 2 and 3 compatibility. basestring is used to check if model.scoring is a string
@@ -438,11 +596,18 @@ class Phrases(interfaces.TransformationABC):
                     model.scoring = npmi_scorer
                 else:
                     raise ValueError('failed to load Phrases model with unknown scoring setting %s' % (model.scoring))
+        # older versions stored bigrams under delimiter-joined keys, convert them to tuple keys
+        if not hasattr(model, 'bigrams_as_tuples'):
+            logger.info('older version of Phrases loaded with delimiter-joined bigram keys')
+            logger.info('converting bigram keys to (word_a, word_b) tuples')
+            _bigrams_as_tuples(model.vocab, model.delimiter)
+            model.bigrams_as_tuples = True
         return model
 
 
 # these two built-in scoring methods don't cast everything to float because the casting is done in the call
-# to the scoring method in __getitem__ and export_phrases.
+# to the scoring method in __getitem__ and export_phrases. export_phrases scores whole batches of bigrams at
+# once, with numpy arrays of counts: original_scorer works on them as is, npmi_scorer has an array version.
 
 # calculation of score based on original mikolov word2vec paper
 def original_scorer(worda_count, wordb_count, bigram_count, len_vocab, min_count, corpus_word_count):
@@ -450,21 +615,82 @@ def original_scorer(worda_count, wordb_count, bigram_count, len_vocab, min_count
 
 
 # normalized PMI, requires corpus size
+# pab / (pa * pb) = count_ab * N / (count_a * count_b), so the corpus size N only
+# needs a single multiplication and division, and there are only two logs to take
 def npmi_scorer(worda_count, wordb_count, bigram_count, len_vocab, min_count, corpus_word_count):
-    pa = worda_count / corpus_word_count
-    pb = wordb_count / corpus_word_count
-    pab = bigram_count / corpus_word_count
-    return log(pab / (pa * pb)) / -log(pab)
+    pmi = log(bigram_count * corpus_word_count / (worda_count * wordb_count))
+    return pmi / -log(bigram_count / corpus_word_count)
+
+
+# the same as npmi_scorer, for numpy arrays of counts
+def _npmi_scorer_array(worda_count, wordb_count, bigram_count, len_vocab, min_count, corpus_word_count):
+    pmi = np.log(bigram_count * corpus_word_count / (worda_count * wordb_count))
+    return pmi / -np.log(bigram_count / corpus_word_count)
 
 
 def pseudocorpus(source_vocab, sep):
-    """Feeds source_vocab's compound keys back to it, to discover phrases"""
+    """
+    Feeds source_vocab's bigram keys back to it, to discover phrases.
+
+    Each bigram key is yielded as is, as a `(word_a, word_b)` two-token sentence; unigram
+    keys are skipped. `sep` is unused since bigrams are stored as tuples; it is only kept
+    for backward compatibility.
+
+    """
     for k in source_vocab:
-        if sep not in k:
+        if isinstance(k, tuple):
+            yield k
+
+
+def _bigrams_as_tuples(vocab, delimiter):
+    """
+    Convert a `vocab` from older Phrases versions, where bigrams were stored under
+    `delimiter`-joined keys, to `(word_a, word_b)` tuple keys, in place.
+
+    A joined key is split at the first position where both halves are known tokens; keys
+    that don't split that way are plain tokens. Joined keys that are also a half of some
+    other bigram (phrases of phrases) are kept as tokens too.
+
+    """
+    bigrams = {}
+    for key in vocab:
+        if delimiter not in key:
             continue
-        unigrams = k.split(sep)
+        unigrams = key.split(delimiter)
         for i in range(1, len(unigrams)):
-            yield [sep.join(unigrams[:i]), sep.join(unigrams[i:])]
+            bigram = (delimiter.join(unigrams[:i]), delimiter.join(unigrams[i:]))
+            if bigram[0] in vocab and bigram[1] in vocab:
+                bigrams[key] = bigram
+                break
+    tokens = set(it.chain.from_iterable(itervalues(bigrams)))
+    for key, bigram in iteritems(bigrams):
+        vocab[bigram] = vocab[key] if key in tokens else vocab.pop(key)
+    return vocab
+
+
+class _PhrasegramsView(Mapping):
+    """
+    Read-only `{(word_a, word_b): (count, score)}` mapping over the phrase index and arrays of a
+    :class:`Phraser`, with utf8 bytestring words. Lookups are O(1), nothing is copied.
+    """
+
+    def __init__(self, phraser):
+        self._phraser = phraser
+
+    def __getitem__(self, bigram):
+        try:
+            word_a, word_b = bigram
+            row = self._phraser._phrase_index[(utils.to_unicode(word_a), utils.to_unicode(word_b))]
+        except (TypeError, ValueError, KeyError):
+            raise KeyError(bigram)
+        return self._phraser._phrase_counts[row].item(), self._phraser._phrase_scores[row].item()
+
+    def __iter__(self):
+        for word_a, word_b in self._phraser._phrase_index:
+            yield utils.to_utf8(word_a), utils.to_utf8(word_b)
+
+    def __len__(self):
+        return len(self._phraser._phrase_index)
 
 
 class Phraser(interfaces.TransformationABC):
@@ -478,25 +704,71 @@ class Phraser(interfaces.TransformationABC):
     `scoring` settings. (You can tamper with those & create a new Phraser to try
     other values.)
 
+    The phrases are stored as a `(word_a, word_b)` => row index, plus numpy arrays
+    of the scores and counts of each row. The index is keyed by unicode strings, so
+    that unicode input tokens are looked up as they are, without encoding them to
+    utf8 first. The `phrasegrams` property gives the phrases back as a
+    `{(word_a, word_b): (count, score)}` dict, with utf8 bytestring words.
+
+    Scores are only ever compared against `threshold`, so they can be stored with
+    `score_dtype=np.float32` to halve the memory of the scores array, at the price
+    of float32 precision in `phrasegrams`. The default is `np.float64`.
+
     """
 
-    def __init__(self, phrases_model):
+    def __init__(self, phrases_model, score_dtype=np.float64):
+        score_dtype = np.dtype(score_dtype)
+        if score_dtype not in (np.float32, np.float64):
+            raise ValueError('score_dtype must be float32 or float64, got %s' % score_dtype)
+
         self.threshold = phrases_model.threshold
         self.min_count = phrases_model.min_count
         self.delimiter = phrases_model.delimiter
         self.scoring = phrases_model.scoring
-        self.phrasegrams = {}
+        phrasegrams = {}
         corpus = pseudocorpus(phrases_model.vocab, phrases_model.delimiter)
         logger.info('source_vocab length %i', len(phrases_model.vocab))
         count = 0
         for bigram, score in phrases_model.export_phrases(corpus, self.delimiter, as_tuples=True):
-            if bigram in self.phrasegrams:
+            if bigram in phrasegrams:
                 logger.info('Phraser repeat %s', bigram)
-            self.phrasegrams[bigram] = (phrases_model.vocab[self.delimiter.join(bigram)], score)
+            phrasegrams[bigram] = (phrases_model.vocab[bigram], score)
             count += 1
             if not count % 50000:
                 logger.info('Phraser added %i phrasegrams', count)
-        logger.info('Phraser built with %i %i phrasegrams', count, len(self.phrasegrams))
+        self._set_phrasegrams(phrasegrams, score_dtype)
+        logger.info('Phraser built with %i %i phrasegrams', count, len(self._phrase_index))
+
+    def _set_phrasegrams(self, phrasegrams, score_dtype=np.float64):
+        """
+        Store the `{(word_a, word_b): (count, score)}` dict `phrasegrams` as an index + count and score arrays,
+        with scores of type `score_dtype`.
+        """
+        to_unicode = utils.to_unicode
+        self._phrase_index = {}  # (unicode word_a, unicode word_b) => row in _phrase_counts and _phrase_scores
+        self._phrase_counts = np.empty(len(phrasegrams), dtype=np.int64)
+        scores = np.empty(len(phrasegrams), dtype=np.float64)
+        for row, (bigram, (count, score)) in enumerate(iteritems(phrasegrams)):
+            self._phrase_index[(to_unicode(bigram[0]), to_unicode(bigram[1]))] = row
+            self._phrase_counts[row] = count
+            scores[row] = score
+
+        score_dtype = np.dtype(score_dtype)
+        self._phrase_scores = scores.astype(score_dtype)
+        # a score just above the threshold can be rounded down onto it by a narrower dtype, and the phrase
+        # would no longer pass the threshold check; bump those to the next representable value instead
+        rounded_down = (self._phrase_scores <= self.threshold) & (scores > self.threshold)
+        self._phrase_scores[rounded_down] = np.nextafter(
+            self._phrase_scores[rounded_down], score_dtype.type(np.inf)
+        )
+
+    @property
+    def phrasegrams(self):
+        """
+        Read-only `{(word_a, word_b): (count, score)}` mapping of all phrases, a live view of the
+        phrase index and arrays. Use `dict(phraser.phrasegrams)` for a modifiable copy.
+        """
+        return _PhrasegramsView(self)
 
     def __getitem__(self, sentence):
         """
@@ -515,28 +787,30 @@ class Phraser(interfaces.TransformationABC):
             # return an iterable stream.
             return self._apply(sentence)
 
-        s, new_s = [utils.any2utf8(w) for w in sentence], []
-        last_bigram = False
-        phrasegrams = self.phrasegrams
-        delimiter = self.delimiter
-        for word_a, word_b in zip(s, s[1:]):
-            bigram_tuple = (word_a, word_b)
-            if phrasegrams.get(bigram_tuple, (-1, -1))[1] > self.threshold and not last_bigram:
-                bigram_word = delimiter.join((word_a, word_b))
-                new_s.append(bigram_word)
-                last_bigram = True
-                continue
-
-            if not last_bigram:
-                new_s.append(word_a)
-            last_bigram = False
-
-        if s:  # add last word skipped by previous loop
-            last_token = s[-1]
-            if not last_bigram:
-                new_s.append(last_token)
+        return apply_phrases(
+            sentence, self._phrase_index, self._phrase_scores, utils.to_unicode(self.delimiter), self.threshold
+        )
 
-        return [utils.to_unicode(w) for w in new_s]
+    @classmethod
+    def load(cls, *args, **kwargs):
+        """
+        Load a previously saved Phraser class. Handles backwards compatibility from older Phraser versions which
+            stored a `phrasegrams` dict instead of the index and arrays, or indexed phrases by utf8 bytestrings.
+            Otherwise, relies on utils.load
+        """
+        model = super(Phraser, cls).load(*args, **kwargs)
+        if 'phrasegrams' in model.__dict__:
+            logger.info('older version of Phraser loaded with phrasegrams dict, converting to arrays')
+            model._set_phrasegrams(model.__dict__.pop('phrasegrams'))
+        else:
+            first = next(iter(model._phrase_index), None)
+            if first is not None and isinstance(first[0], bytes):
+                logger.info('older version of Phraser loaded with utf8 phrase index, converting to unicode')
+                model._phrase_index = {
+                    (utils.to_unicode(word_a), utils.to_unicode(word_b)): row
+                    for (word_a, word_b), row in iteritems(model._phrase_index)
+                }
+        return model
 
 
 if __name__ == '__main__':
@@ -0,0 +1,139 @@
+#!/usr/bin/env cython
+# cython: boundscheck=False
+# cython: wraparound=False
+# coding: utf-8
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""Optimized cython functions for collecting and applying phrase statistics, see :mod:`gensim.models.phrases`."""
+
+from cpython.dict cimport PyDict_GetItem, PyDict_Next, PyDict_SetItem
+from cpython.ref cimport PyObject
+from cython cimport floating
+
+from gensim.utils import any2unicode, any2utf8, prune_vocab
+
+
+cdef inline bytes to_utf8(word):
+    # fast path for unicode tokens, everything else goes through the full any2utf8 round trip
+    if isinstance(word, unicode):
+        return (<unicode>word).encode('utf8')
+    return any2utf8(word)
+
+
+cdef inline unicode to_unicode(word):
+    # fast path for unicode tokens, which are used as they are
+    if isinstance(word, unicode):
+        return <unicode>word
+    return any2unicode(word)
+
+
+cdef inline bytes intern_word(dict interned, bytes word):
+    cdef PyObject *canonical = PyDict_GetItem(interned, word)
+    if canonical == NULL:
+        PyDict_SetItem(interned, word, word)
+        return word
+    return <bytes>canonical
+
+
+cdef inline int check_dict(obj, name) except -1:
+    # the PyDict_* functions below don't check their argument's type. typing the arguments as
+    # `dict` would only accept exact dicts, not the defaultdict of Phrases.vocab
+    if not isinstance(obj, dict):
+        raise TypeError("%s must be a dict, got %s" % (name, type(obj).__name__))
+    return 0
+
+
+cdef inline int increment(vocab, key) except -1:
+    cdef PyObject *count = PyDict_GetItem(vocab, key)
+    if count == NULL:
+        return PyDict_SetItem(vocab, key, 1)
+    return PyDict_SetItem(vocab, key, <object>count + 1)
+
+
+cdef inline int add_count(vocab, key, count) except -1:
+    cdef PyObject *current = PyDict_GetItem(vocab, key)
+    if current == NULL:
+        return PyDict_SetItem(vocab, key, count)
+    return PyDict_SetItem(vocab, key, <object>current + count)
+
+
+def count_bigrams(sentences, vocab, dict interned, Py_ssize_t max_vocab_size, int min_reduce):
+    """
+    Update `vocab` with the unigram and bigram counts from a batch of `sentences`,
+    pruning it whenever its size exceeds `max_vocab_size`. Bigrams are counted
+    under `(word_a, word_b)` tuple keys.
+
+    Tokens are interned through the `interned` dict, so that repeated tokens (and the
+    bigram tuples built from them) share a single bytestring object. It is cleared on
+    every prune.
+
+    Return the number of words and sentences processed, and the updated `min_reduce`.
+
+    """
+    cdef bytes word, prev_word
+    cdef long long total_words = 0
+    cdef long long total_sentences = 0
+
+    check_dict(vocab, 'vocab')
+    for sentence in sentences:
+        total_sentences += 1
+        prev_word = None
+        for token in sentence:
+            word = intern_word(interned, to_utf8(token))
+            increment(vocab, word)
+            if prev_word is not None:
+                increment(vocab, (prev_word, word))
+            prev_word = word
+            total_words += 1
+
+        if len(vocab) > max_vocab_size:
+            prune_vocab(vocab, min_reduce)
+            interned.clear()
+            min_reduce += 1
+
+    return total_words, total_sentences, min_reduce
+
+
+def merge_counts(vocab, other):
+    """Add the counts of all keys in the `other` dict to the ones in the `vocab` dict."""
+    cdef Py_ssize_t pos = 0
+    cdef PyObject *key
+    cdef PyObject *count
+
+    check_dict(vocab, 'vocab')
+    check_dict(other, 'other')
+    while PyDict_Next(other, &pos, &key, &count):
+        add_count(vocab, <object>key, <object>count)
+
+
+def apply_phrases(sentence, dict phrase_index, const floating[:] phrase_scores, unicode delimiter, double threshold):
+    """
+    Return the tokens of `sentence` as a list of unicode strings, with each bigram
+    whose row in `phrase_index` scores above `threshold` in `phrase_scores` joined
+    into a single token by the unicode `delimiter`. `phrase_index` is keyed by
+    `(word_a, word_b)` tuples of unicode strings. A word that was joined into a
+    phrase can't start another one.
+
+    """
+    cdef list new_s = []
+    cdef unicode word, prev_word = None
+    cdef tuple bigram
+    cdef PyObject *row
+
+    for token in sentence:
+        word = to_unicode(token)
+        if prev_word is not None:
+            bigram = (prev_word, word)
+            row = PyDict_GetItem(phrase_index, bigram)
+            if row != NULL and phrase_scores[<Py_ssize_t><object>row] > threshold:
+                new_s.append(prev_word + delimiter + word)
+                prev_word = None
+                continue
+            new_s.append(prev_word)
+        prev_word = word
+
+    if prev_word is not None:  # add last word skipped by previous loop
+        new_s.append(prev_word)
+
+    return new_s
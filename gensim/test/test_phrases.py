@@ -10,11 +10,22 @@ Automated tests for checking transformation algorithms (the models package).
 
 import logging
 import unittest
+import itertools as it
 import os
 import sys
+from collections import defaultdict
+
+import numpy as np
 
 from gensim import utils
 from gensim.models.phrases import Phrases, Phraser
+from gensim.models.phrases import npmi_scorer, _npmi_scorer_array, _token_batches
+from gensim.models.phrases import _count_bigrams_py, _merge_counts_py, _apply_phrases_py
+
+try:
+    from gensim.models import phrases_inner
+except ImportError:
+    phrases_inner = None
 
 if sys.version_info[0] >= 3:
     unicode = str
@@ -131,6 +142,11 @@ def dumb_scorer(worda_count, wordb_count, bigram_count, len_vocab, min_count, co
     return 1
 
 
+# all scores will be just above the default threshold of 10.0, by less than float32 precision
+def threshold_scorer(worda_count, wordb_count, bigram_count, len_vocab, min_count, corpus_word_count):
+    return 10.0000001
+
+
 class TestPhrasesModel(unittest.TestCase):
     def testExportPhrases(self):
         """Test Phrases bigram export_phrases functionality."""
@@ -143,6 +159,25 @@ class TestPhrasesModel(unittest.TestCase):
 
         assert seen_bigrams == {b'response time', b'graph minors', b'human interface'}
 
+    def testExportPhrasesBatchWords(self):
+        """Test that export_phrases gives the same phrases and scores for any batch_words."""
+        # long sentences, which don't fit in a single batch
+        long_sentences = [list(it.chain.from_iterable(sentences))] * 3 + sentences
+        # a batch is closed as soon as it reaches batch_words, so it never holds more than a sentence over
+        longest = max(len(sentence) + 1 for sentence in long_sentences)
+        for batch in _token_batches(long_sentences, 20):
+            self.assertTrue(len(batch) < 20 + longest)
+        for scoring, threshold in (('default', 1), ('npmi', .1), (dumb_scorer, .001)):
+            bigram = Phrases(sentences, min_count=1, threshold=threshold, scoring=scoring)
+            for test_sentences in (sentences, long_sentences):
+                expected = list(bigram.export_phrases(test_sentences))
+                self.assertTrue(expected)
+                for batch_words in (1, 7, 20):
+                    exported = list(bigram.export_phrases(test_sentences, batch_words=batch_words))
+                    self.assertEqual([phrase for phrase, _ in exported], [phrase for phrase, _ in expected])
+                    for (_, score), (_, expected_score) in zip(exported, expected):
+                        self.assertAlmostEqual(score, expected_score)
+
     def testMultipleBigramsSingleEntry(self):
         """ a single entry should produce multiple bigrams. """
         bigram = Phrases(sentences, min_count=1, threshold=1)
@@ -193,6 +228,19 @@ class TestPhrasesModel(unittest.TestCase):
             .714  # score for human interface
         }
 
+    def testNpmiScorer(self):
+        """Test the npmi scorer on single counts, and its version for arrays of counts."""
+        counts = dict(worda_count=5.0, wordb_count=7.0, bigram_count=3.0, len_vocab=100.0, min_count=1.0)
+        score = npmi_scorer(corpus_word_count=1000.0, **counts)
+        self.assertTrue(type(score) is float)
+        array_counts = {name: np.array([count, count]) for name, count in counts.items()}
+        array_scores = _npmi_scorer_array(corpus_word_count=1000.0, **array_counts)
+        self.assertEqual(array_scores.shape, (2,))
+        for array_score in array_scores:
+            self.assertAlmostEqual(array_score, score)
+        # a bigram making up the whole corpus has no defined npmi
+        self.assertRaises(ZeroDivisionError, npmi_scorer, corpus_word_count=3.0, **counts)
+
     def testCustomScorer(self):
         """ test using a custom scoring function """
 
@@ -219,6 +267,23 @@ class TestPhrasesModel(unittest.TestCase):
         bigram = Phrases(sentences, max_vocab_size=5)
         self.assertTrue(len(bigram.vocab) <= 5)
 
+    def testProgressPer(self):
+        """Test that counting the sentences in batches of progress_per gives the same vocab."""
+        bigram = Phrases(sentences, min_count=1, threshold=1)
+        for progress_per in (1, 3):
+            bigram_chunked = Phrases(gen_sentences(), min_count=1, threshold=1, progress_per=progress_per)
+            self.assertEqual(bigram.vocab, bigram_chunked.vocab)
+            self.assertEqual(bigram.corpus_word_count, bigram_chunked.corpus_word_count)
+
+    def testAddVocab(self):
+        """Test that adding sentences to a vocab in several steps gives the same vocab."""
+        bigram = Phrases(sentences, min_count=1, threshold=1)
+        for split in (2, len(sentences) - 2):
+            bigram_added = Phrases(sentences[:split], min_count=1, threshold=1)
+            bigram_added.add_vocab(sentences[split:])
+            self.assertEqual(bigram.vocab, bigram_added.vocab)
+            self.assertEqual(bigram.corpus_word_count, bigram_added.corpus_word_count)
+
     def testSaveLoadCustomScorer(self):
         """ saving and loading a Phrases object with a custom scorer """
 
@@ -304,6 +369,50 @@ class TestPhrasesModel(unittest.TestCase):
         finally:
             if os.path.exists("test_phrases_testSaveLoadNoScoring_temp_save.pkl"):
                 os.remove("test_phrases_testSaveLoadNoScoring_temp_save.pkl")
+
+    def testSaveLoadJoinedBigramKeys(self):
+        """ Saving and loading a Phrases object with delimiter-joined bigram keys.
+        This should ensure backwards compatibility with old versions of Phrases"""
+
+        try:
+            bigram = Phrases(sentences, min_count=1, threshold=1)
+            expected_vocab = dict(bigram.vocab)
+            for word in list(bigram.vocab):
+                if isinstance(word, tuple):
+                    bigram.vocab[bigram.delimiter.join(word)] = bigram.vocab.pop(word)
+            del bigram.bigrams_as_tuples
+            bigram.save("test_phrases_testSaveLoadJoinedBigramKeys_temp_save.pkl")
+            bigram_loaded = Phrases.load("test_phrases_testSaveLoadJoinedBigramKeys_temp_save.pkl")
+            self.assertEqual(dict(bigram_loaded.vocab), expected_vocab)
+            seen_scores = set()
+            test_sentences = [['graph', 'minors', 'survey', 'human', 'interface', 'system']]
+            for phrase, score in bigram_loaded.export_phrases(test_sentences):
+                seen_scores.add(round(score, 3))
+
+            assert seen_scores == set([
+                5.167,  # score for graph minors
+                3.444  # score for human interface
+            ])
+
+        finally:
+            if os.path.exists("test_phrases_testSaveLoadJoinedBigramKeys_temp_save.pkl"):
+                os.remove("test_phrases_testSaveLoadJoinedBigramKeys_temp_save.pkl")
+
+    def testSaveLoadDelimiterToken(self):
+        """ Saving and loading a Phrases object with no bigrams and a token containing the delimiter.
+        The token must not be mistaken for a delimiter-joined bigram of older versions"""
+
+        try:
+            bigram = Phrases([['a'], ['b'], ['a_b'], ['a'], ['b']], min_count=1)
+            expected_vocab = dict(bigram.vocab)
+            self.assertEqual(expected_vocab, {b'a': 2, b'b': 2, b'a_b': 1})
+            bigram.save("test_phrases_testSaveLoadDelimiterToken_temp_save.pkl")
+            bigram_loaded = Phrases.load("test_phrases_testSaveLoadDelimiterToken_temp_save.pkl")
+            self.assertEqual(dict(bigram_loaded.vocab), expected_vocab)
+
+        finally:
+            if os.path.exists("test_phrases_testSaveLoadDelimiterToken_temp_save.pkl"):
+                os.remove("test_phrases_testSaveLoadDelimiterToken_temp_save.pkl")
 # endclass TestPhrasesModel
 
 
@@ -324,6 +433,123 @@ class TestPhraserModel(TestPhrasesCommon):
         bigram_unicode_phrases = Phrases(unicode_sentences, min_count=1, threshold=1)
         self.bigram_unicode = Phraser(bigram_unicode_phrases)
 
+    def testSaveLoad(self):
+        """ Saving and loading a Phraser object."""
+
+        try:
+            self.bigram.save("test_phraser_testSaveLoad_temp_save.pkl")
+            bigram_loaded = Phraser.load("test_phraser_testSaveLoad_temp_save.pkl")
+            self.assertEqual(bigram_loaded.phrasegrams, self.bigram.phrasegrams)
+            self.assertEqual(bigram_loaded[sentences[-1]], self.bigram[sentences[-1]])
+
+        finally:
+            if os.path.exists("test_phraser_testSaveLoad_temp_save.pkl"):
+                os.remove("test_phraser_testSaveLoad_temp_save.pkl")
+
+    def testSaveLoadPhrasegramsDict(self):
+        """ Saving and loading a Phraser object storing a phrasegrams dict.
+        This should ensure backwards compatibility with old versions of Phraser"""
+
+        try:
+            phrasegrams = dict(self.bigram.phrasegrams)
+            for attr in ('_phrase_index', '_phrase_counts', '_phrase_scores'):
+                delattr(self.bigram, attr)
+            self.bigram.__dict__['phrasegrams'] = phrasegrams
+            self.bigram.save("test_phraser_testSaveLoadPhrasegramsDict_temp_save.pkl")
+            bigram_loaded = Phraser.load("test_phraser_testSaveLoadPhrasegramsDict_temp_save.pkl")
+            self.assertEqual(bigram_loaded.phrasegrams, phrasegrams)
+            self.assertEqual(bigram_loaded[sentences[-1]], [u'graph_minors', u'survey', u'human_interface'])
+
+        finally:
+            if os.path.exists("test_phraser_testSaveLoadPhrasegramsDict_temp_save.pkl"):
+                os.remove("test_phraser_testSaveLoadPhrasegramsDict_temp_save.pkl")
+
+    def testPhrasegrams(self):
+        """Test the read-only phrasegrams mapping."""
+        phrasegrams = self.bigram.phrasegrams
+        self.assertEqual(len(phrasegrams), len(dict(phrasegrams)))
+        count, score = phrasegrams[(b'graph', b'minors')]
+        self.assertEqual(count, 3)
+        self.assertEqual(round(score, 3), 5.167)
+        self.assertTrue((b'graph', b'minors') in phrasegrams)
+        self.assertFalse((b'graph', b'survey') in phrasegrams)
+        with self.assertRaises(TypeError):
+            phrasegrams[(b'graph', b'survey')] = (1, 100.0)
+
+    def testSaveLoadUtf8PhraseIndex(self):
+        """ Saving and loading a Phraser object with a phrase index keyed by utf8 bytestrings.
+        This should ensure backwards compatibility with old versions of Phraser"""
+
+        try:
+            self.bigram._phrase_index = {
+                (utils.to_utf8(word_a), utils.to_utf8(word_b)): row
+                for (word_a, word_b), row in self.bigram._phrase_index.items()
+            }
+            self.bigram.save("test_phraser_testSaveLoadUtf8PhraseIndex_temp_save.pkl")
+            bigram_loaded = Phraser.load("test_phraser_testSaveLoadUtf8PhraseIndex_temp_save.pkl")
+            self.assertEqual(bigram_loaded[sentences[-1]], [u'graph_minors', u'survey', u'human_interface'])
+
+        finally:
+            if os.path.exists("test_phraser_testSaveLoadUtf8PhraseIndex_temp_save.pkl"):
+                os.remove("test_phraser_testSaveLoadUtf8PhraseIndex_temp_save.pkl")
+
+    def testScoreDtype(self):
+        """Test a Phraser storing its scores as float32."""
+        bigram_phrases = Phrases(sentences, min_count=1, threshold=1)
+        bigram_float32 = Phraser(bigram_phrases, score_dtype=np.float32)
+        self.assertEqual(bigram_float32._phrase_scores.dtype, np.float32)
+        self.assertEqual(bigram_float32.phrasegrams.keys(), self.bigram.phrasegrams.keys())
+        for s in sentences:
+            self.assertEqual(bigram_float32[s], self.bigram[s])
+
+        self.assertRaises(ValueError, Phraser, bigram_phrases, score_dtype=np.int16)
+
+    def testScoreDtypeThreshold(self):
+        """Test a Phraser storing float32 scores keeps phrases scored just above the threshold."""
+        bigram_phrases = Phrases(sentences, min_count=1, threshold=10.0, scoring=threshold_scorer)
+        bigram_float64 = Phraser(bigram_phrases)
+        bigram_float32 = Phraser(bigram_phrases, score_dtype=np.float32)
+        self.assertEqual(bigram_float64[[u'graph', u'minors']], [u'graph_minors'])
+        for s in sentences:
+            self.assertEqual(bigram_float32[s], bigram_float64[s])
+
+
+@unittest.skipIf(phrases_inner is None, "compiled phrases_inner extension is not available")
+class TestPhrasesInner(unittest.TestCase):
+    """ Test that the compiled phrases_inner functions match their pure python versions."""
+
+    def setUp(self):
+        # bytes and unicode tokens, non-ascii text and empty sentences
+        self.sentences = sentences + [
+            [], [b'graph', b'minors', b'survey'], [u'graph', b'minors', u'survey'], [],
+            [u'\u017elu\u0165ou\u010dk\xfd', u'k\u016f\u0148'], [u'\u017elu\u0165ou\u010dk\xfd', u'k\u016f\u0148'],
+            [utils.to_utf8(u'\u017elu\u0165ou\u010dk\xfd'), utils.to_utf8(u'k\u016f\u0148'), u'graph'],
+        ]
+
+    def testCountBigrams(self):
+        for max_vocab_size in (40000000, 10):
+            vocab, vocab_py = defaultdict(int), defaultdict(int)
+            result = phrases_inner.count_bigrams(self.sentences, vocab, {}, max_vocab_size, 1)
+            result_py = _count_bigrams_py(self.sentences, vocab_py, {}, max_vocab_size, 1)
+            self.assertEqual(result, result_py)
+            self.assertEqual(vocab, vocab_py)
+
+    def testMergeCounts(self):
+        other = Phrases(self.sentences, min_count=1).vocab
+        vocab, vocab_py = Phrases(sentences, min_count=1).vocab, Phrases(sentences, min_count=1).vocab
+        phrases_inner.merge_counts(vocab, other)
+        _merge_counts_py(vocab_py, other)
+        self.assertEqual(vocab, vocab_py)
+
+    def testApplyPhrases(self):
+        bigram_phrases = Phrases(self.sentences, min_count=1, threshold=1)
+        for score_dtype in (np.float64, np.float32):
+            bigram = Phraser(bigram_phrases, score_dtype=score_dtype)
+            args = (bigram._phrase_index, bigram._phrase_scores, utils.to_unicode(bigram.delimiter), bigram.threshold)
+            for s in self.sentences:
+                self.assertEqual(phrases_inner.apply_phrases(s, *args), _apply_phrases_py(s, *args))
+                self.assertEqual(phrases_inner.apply_phrases(iter(s), *args), _apply_phrases_py(iter(s), *args))
+
 
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
@@ -1114,10 +1114,13 @@ def prune_vocab(vocab, min_reduce, trim_rule=None):
     """
     result = 0
     old_len = len(vocab)
-    for w in list(vocab):  # make a copy of dict's keys
-        if not keep_vocab_item(w, vocab[w], min_reduce, trim_rule):  # vocab[w] <= min_reduce:
-            result += vocab[w]
-            del vocab[w]
+    if trim_rule is None:
+        # common case: a plain count threshold, skip the per-item keep_vocab_item call
+        pruned = [w for w, count in iteritems(vocab) if count < min_reduce]
+    else:
+        pruned = [w for w in vocab if not keep_vocab_item(w, vocab[w], min_reduce, trim_rule)]
+    for w in pruned:
+        result += vocab.pop(w)
     logger.info("pruned out %i tokens with count <=%i (before %i, after %i)", old_len - len(vocab), min_reduce, old_len, len(vocab))
     return result
 
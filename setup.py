@@ -247,6 +247,9 @@ setup(
             include_dirs=[model_dir]),
         Extension('gensim.models.doc2vec_inner',
             sources=['./gensim/models/doc2vec_inner.c'],
+            include_dirs=[model_dir]),
+        Extension('gensim.models.phrases_inner',
+            sources=['./gensim/models/phrases_inner.c'],
             include_dirs=[model_dir])
     ],
     cmdclass=cmdclass,